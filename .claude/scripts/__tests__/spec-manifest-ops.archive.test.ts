@@ -8,14 +8,22 @@
  *   node --experimental-strip-types --disable-warning=ExperimentalWarning \
  *     .claude/scripts/__tests__/spec-manifest-ops.archive.test.ts
  *
- * Each test builds a throwaway `specs/` tree in the OS temp dir (which is NOT a
- * git repo, so the script's findProjectRoot() falls back to process.cwd()) and
- * drives the real CLI against it via execFileSync with cwd set to that temp dir.
+ * Each test builds a throwaway `specs/` tree in the OS temp dir (findProjectRoot()
+ * resolves it as the root because it holds `specs/manifest.json`) and drives the
+ * real CLI against it via execFileSync with cwd set to that temp dir.
  */
 import { test } from 'node:test';
 import assert from 'node:assert/strict';
 import { execFileSync } from 'node:child_process';
-import { mkdtempSync, mkdirSync, writeFileSync, readFileSync, existsSync, rmSync } from 'node:fs';
+import {
+  mkdtempSync,
+  mkdirSync,
+  writeFileSync,
+  readFileSync,
+  existsSync,
+  rmSync,
+  symlinkSync,
+} from 'node:fs';
 import { join, dirname } from 'node:path';
 import { tmpdir } from 'node:os';
 import { fileURLToPath } from 'node:url';
@@ -186,6 +194,36 @@ test('audit ignores the specs/archive/ directory (not treated as an orphan spec)
   }
 });
 
+test('audit and list --archived follow symlinked spec directories', () => {
+  const root = makeSandbox(
+    {
+      version: 1,
+      nextNumber: 2,
+      specs: [
+        { number: 1, slug: 'linked', title: 'Linked', created: '2026-01-01', status: 'ideation' },
+      ],
+    },
+    []
+  );
+  // specs/linked and specs/archive/linked-old point at directories outside specs/.
+  for (const name of ['linked', 'linked-old']) {
+    mkdirSync(join(root, 'elsewhere', name), { recursive: true });
+    writeFileSync(join(root, 'elsewhere', name, '01-ideation.md'), `# ${name}\n`);
+  }
+  symlinkSync(join('..', 'elsewhere', 'linked'), join(root, 'specs', 'linked'));
+  mkdirSync(join(root, 'specs', 'archive'), { recursive: true });
+  symlinkSync(
+    join('..', '..', 'elsewhere', 'linked-old'),
+    join(root, 'specs', 'archive', 'linked-old')
+  );
+  try {
+    assert.match(runCli(root, ['audit']), /All clear/);
+    assert.deepEqual(JSON.parse(runCli(root, ['list', '--archived', '--json'])), ['linked-old']);
+  } finally {
+    rmSync(root, { recursive: true, force: true });
+  }
+});
+
 test('list --archived lists archived spec dirs and excludes README.md', () => {
   const root = makeSandbox(
     {
@@ -0,0 +1,126 @@
+/**
+ * Tests for how spec-manifest-ops.ts writes specs/manifest.json.
+ *
+ * Idempotent commands must not rewrite an unchanged manifest, and real writes
+ * go through a temp file + rename so no partial manifest is ever visible. Run
+ * directly:
+ *
+ *   node --experimental-strip-types --disable-warning=ExperimentalWarning \
+ *     .claude/scripts/__tests__/spec-manifest-ops.write.test.ts
+ */
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { execFileSync } from 'node:child_process';
+import {
+  mkdtempSync,
+  mkdirSync,
+  writeFileSync,
+  readFileSync,
+  readdirSync,
+  statSync,
+  rmSync,
+} from 'node:fs';
+import { join, dirname } from 'node:path';
+import { tmpdir } from 'node:os';
+import { fileURLToPath } from 'node:url';
+
+const SCRIPT = join(dirname(fileURLToPath(import.meta.url)), '..', 'spec-manifest-ops.ts');
+
+const CLEAN_MANIFEST = {
+  version: 1,
+  specs: [
+    {
+      id: '260701-120000',
+      slug: 'my-feature',
+      title: 'My Feature',
+      created: '2026-07-01',
+      status: 'ideation',
+    },
+  ],
+};
+
+/** Build a temp project with one spec dir (`my-feature`) and the given manifest. */
+function sandbox(manifest: object): string {
+  const root = mkdtempSync(join(tmpdir(), 'spec-manifest-write-'));
+  mkdirSync(join(root, 'specs', 'my-feature'), { recursive: true });
+  writeFileSync(join(root, 'specs', 'my-feature', '01-ideation.md'), '# My Feature\n');
+  writeFileSync(join(root, 'specs', 'manifest.json'), JSON.stringify(manifest, null, 2) + '\n');
+  return root;
+}
+
+/** Run the CLI from the sandbox root (or `cwd`); returns stdout. Throws on non-zero exit. */
+function runCli(root: string, args: string[], cwd: string = root): string {
+  return execFileSync(
+    'node',
+    ['--experimental-strip-types', '--disable-warning=ExperimentalWarning', SCRIPT, ...args],
+    { cwd, encoding: 'utf-8' }
+  );
+}
+
+/** Absolute path of the sandbox's specs/manifest.json. */
+function manifestPath(root: string): string {
+  return join(root, 'specs', 'manifest.json');
+}
+
+test('fix on an in-sync manifest does not rewrite the file', () => {
+  const root = sandbox(CLEAN_MANIFEST);
+  try {
+    const before = statSync(manifestPath(root)).mtimeMs;
+    const out = runCli(root, ['fix']);
+    assert.match(out, /Total changes: 0/);
+    assert.equal(statSync(manifestPath(root)).mtimeMs, before, 'manifest mtime is unchanged');
+  } finally {
+    rmSync(root, { recursive: true, force: true });
+  }
+});
+
+test('fix still writes when it has something to change', () => {
+  const root = sandbox({
+    ...CLEAN_MANIFEST,
+    specs: [{ ...CLEAN_MANIFEST.specs[0], status: 'draft' }],
+  });
+  try {
+    runCli(root, ['fix']);
+    const m = JSON.parse(readFileSync(manifestPath(root), 'utf-8'));
+    assert.equal(m.specs[0].status, 'ideation');
+  } finally {
+    rmSync(root, { recursive: true, force: true });
+  }
+});
+
+test('writes replace the manifest via rename and leave no temp file behind', () => {
+  const root = sandbox(CLEAN_MANIFEST);
+  try {
+    const before = statSync(manifestPath(root)).ino;
+    runCli(root, ['update-status', 'my-feature', 'specified', '--quiet']);
+    const m = JSON.parse(readFileSync(manifestPath(root), 'utf-8'));
+    assert.equal(m.specs[0].status, 'specified');
+    assert.notEqual(
+      statSync(manifestPath(root)).ino,
+      before,
+      'manifest.json is a new file renamed into place, not rewritten in place'
+    );
+    assert.deepEqual(
+      readdirSync(join(root, 'specs')).filter((f) => f.endsWith('.tmp')),
+      [],
+      'temp file was renamed over manifest.json'
+    );
+  } finally {
+    rmSync(root, { recursive: true, force: true });
+  }
+});
+
+test('run from a nested directory, it writes the manifest of the enclosing project', () => {
+  const root = sandbox(CLEAN_MANIFEST);
+  try {
+    runCli(
+      root,
+      ['update-status', 'my-feature', 'specified', '--quiet'],
+      join(root, 'specs', 'my-feature')
+    );
+    const m = JSON.parse(readFileSync(manifestPath(root), 'utf-8'));
+    assert.equal(m.specs[0].status, 'specified');
+  } finally {
+    rmSync(root, { recursive: true, force: true });
+  }
+});
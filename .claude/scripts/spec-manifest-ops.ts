@@ -36,6 +36,8 @@ import {
   statSync,
   renameSync,
   mkdirSync,
+  unlinkSync,
+  type Dirent,
 } from 'node:fs';
 import { join, dirname } from 'node:path';
 import { execSync } from 'node:child_process';
@@ -80,6 +82,9 @@ interface AuditFinding {
 
 const CANONICAL_STATUSES = ['ideation', 'specified', 'implemented', 'superseded'] as const;
 
+/** Membership view of CANONICAL_STATUSES (the tuple keeps display order for help/errors). */
+const CANONICAL_STATUS_SET: ReadonlySet<string> = new Set(CANONICAL_STATUSES);
+
 const STATUS_ORDER: Record<string, number> = {
   ideation: 0,
   specified: 1,
@@ -101,11 +106,26 @@ const ARTIFACT_TO_STATUS: Record<number, string> = {
   5: 'implemented',
 };
 
+/** Matches a numbered spec artifact (`01-ideation.md` … `05-*.json`), capturing its number. */
+const ARTIFACT_FILE_RE = /^0([1-5])-.*\.(md|json)$/;
+
+/** Matches a level-1 Markdown heading, capturing its text. */
+const H1_HEADING_RE = /^#\s+(.+)/;
+
 // ---------------------------------------------------------------------------
 // Path resolution
 // ---------------------------------------------------------------------------
 
+/**
+ * Resolve the project root: the nearest ancestor of the cwd that holds
+ * `specs/manifest.json`. Only when no ancestor has one do we fork
+ * `git rev-parse`, then fall back to the cwd.
+ */
 function findProjectRoot(): string {
+  for (let dir = process.cwd(); ; dir = dirname(dir)) {
+    if (existsSync(join(dir, 'specs', 'manifest.json'))) return dir;
+    if (dirname(dir) === dir) break;
+  }
   try {
     return execSync('git rev-parse --show-toplevel', { encoding: 'utf-8' }).trim();
   } catch {
@@ -118,6 +138,20 @@ const MANIFEST_PATH = join(ROOT, 'specs', 'manifest.json');
 const SPECS_DIR = join(ROOT, 'specs');
 const ARCHIVE_DIR = join(SPECS_DIR, 'archive');
 
+/**
+ * True when a directory entry is a directory. Reads the type from the listing
+ * (no syscall) and only stats symlinks, so a symlinked spec dir still counts.
+ */
+function isDirEntry(parent: string, entry: Dirent): boolean {
+  if (entry.isDirectory()) return true;
+  if (!entry.isSymbolicLink()) return false;
+  try {
+    return statSync(join(parent, entry.name)).isDirectory();
+  } catch {
+    return false;
+  }
+}
+
 // Subdirectories of specs/ that are NOT spec dirs and must be skipped by the
 // filesystem walk (otherwise audit/fix treat them as orphan specs). `archive`
 // holds retired specs (see specs/archive/README.md); `lib` holds shared assets.
@@ -135,8 +169,30 @@ function readManifest(): Manifest {
   return JSON.parse(readFileSync(MANIFEST_PATH, 'utf-8'));
 }
 
+/**
+ * Serialize and write the manifest. Skips the write when the serialized output
+ * is byte-identical to what is already on disk, so idempotent runs (e.g. `fix`
+ * on a clean tree) leave the file and its mtime untouched. Otherwise the buffer
+ * goes to a sibling temp file that is renamed over the manifest, so a crash
+ * mid-write can never leave a truncated manifest.json behind.
+ */
 function writeManifest(manifest: Manifest): void {
-  writeFileSync(MANIFEST_PATH, JSON.stringify(manifest, null, 2) + '\n', 'utf-8');
+  const next = JSON.stringify(manifest, null, 2) + '\n';
+  if (existsSync(MANIFEST_PATH) && readFileSync(MANIFEST_PATH, 'utf-8') === next) return;
+  // Per-process temp name: concurrent writers (hooks, co-tenant agents) must
+  // never share, and so truncate, each other's temp file.
+  const tmpPath = `${MANIFEST_PATH}.${process.pid}.tmp`;
+  try {
+    writeFileSync(tmpPath, next, 'utf-8');
+    renameSync(tmpPath, MANIFEST_PATH);
+  } catch (err) {
+    try {
+      unlinkSync(tmpPath);
+    } catch {
+      // Temp file was never created; nothing to clean up.
+    }
+    throw err;
+  }
 }
 
 function findEntry(manifest: Manifest, slug: string): SpecEntry | undefined {
@@ -161,7 +217,7 @@ function today(): string {
 }
 
 function isCanonical(status: string): boolean {
-  return (CANONICAL_STATUSES as readonly string[]).includes(status);
+  return CANONICAL_STATUS_SET.has(status);
 }
 
 function normalizeStatus(status: string): string {
@@ -170,12 +226,20 @@ function normalizeStatus(status: string): string {
 }
 
 function getHighestArtifact(slug: string): number {
-  const dir = join(SPECS_DIR, slug);
-  if (!existsSync(dir)) return 0;
+  // Callers pass slugs straight from getSpecDirs(), so the directory almost
+  // always exists; list it directly rather than paying an extra existsSync().
+  // Only a missing directory means "no artifacts"; other errors still surface.
+  let files: string[];
+  try {
+    files = readdirSync(join(SPECS_DIR, slug));
+  } catch (err) {
+    if ((err as NodeJS.ErrnoException).code === 'ENOENT') return 0;
+    throw err;
+  }
 
   let highest = 0;
-  for (const file of readdirSync(dir)) {
-    const match = file.match(/^0([1-5])-.*\.(md|json)$/);
+  for (const file of files) {
+    const match = ARTIFACT_FILE_RE.exec(file);
     if (match) {
       const num = parseInt(match[1], 10);
       if (num > highest) highest = num;
@@ -209,7 +273,7 @@ function extractTitle(slug: string): string {
       }
       if (!pastFrontmatter && inFrontmatter) continue;
 
-      const heading = line.match(/^#\s+(.+)/);
+      const heading = H1_HEADING_RE.exec(line);
       if (heading) return heading[1].trim();
     }
   }
@@ -225,14 +289,15 @@ function getSpecDirs(): Set<string> {
   const dirs = new Set<string>();
   if (!existsSync(SPECS_DIR)) return dirs;
 
-  for (const entry of readdirSync(SPECS_DIR)) {
-    const fullPath = join(SPECS_DIR, entry);
+  // withFileTypes reads each entry's type from the directory listing itself,
+  // avoiding one stat() per entry (symlinks are still stat'd by isDirEntry).
+  for (const entry of readdirSync(SPECS_DIR, { withFileTypes: true })) {
     if (
-      statSync(fullPath).isDirectory() &&
-      !entry.startsWith('__') &&
-      !SPEC_DIR_EXCLUDES.has(entry)
+      isDirEntry(SPECS_DIR, entry) &&
+      !entry.name.startsWith('__') &&
+      !SPEC_DIR_EXCLUDES.has(entry.name)
     ) {
-      dirs.add(entry);
+      dirs.add(entry.name);
     }
   }
   return dirs;
@@ -245,11 +310,9 @@ function getSpecDirs(): Set<string> {
  */
 function getArchivedSlugs(): string[] {
   if (!existsSync(ARCHIVE_DIR)) return [];
-  return readdirSync(ARCHIVE_DIR)
-    .filter((entry) => {
-      const fullPath = join(ARCHIVE_DIR, entry);
-      return statSync(fullPath).isDirectory() && !entry.startsWith('__');
-    })
+  return readdirSync(ARCHIVE_DIR, { withFileTypes: true })
+    .filter((entry) => isDirEntry(ARCHIVE_DIR, entry) && !entry.name.startsWith('__'))
+    .map((entry) => entry.name)
     .sort();
 }
 
@@ -628,6 +691,7 @@ function cmdFix(flags: Record<string, string | boolean>): void {
   // 3. Add orphan directories
   const orphanSlugs = [...specDirs].filter((d: string) => !manifestSlugs.has(d)).sort();
   const takenIds = new Set(manifest.specs.map(entryKey));
+  const created = today();
   for (const slug of orphanSlugs) {
     const highest = getHighestArtifact(slug);
     const status = ARTIFACT_TO_STATUS[highest] ?? 'ideation';
@@ -639,7 +703,7 @@ function cmdFix(flags: Record<string, string | boolean>): void {
       id,
       slug,
       title,
-      created: today(),
+      created,
       status,
     };
 
@@ -7,10 +7,7 @@
 export function slugify(text: string): string {
   return text
     .toLowerCase()
-    .replace(/\u2014/g, '-') // em-dash → hyphen
-    .replace(/\u2013/g, '-') // en-dash → hyphen
     .replace(/&/g, 'and')
-    .replace(/[^a-z0-9-]+/g, '-') // non-alphanumeric → hyphen
-    .replace(/-{2,}/g, '-') // collapse multiple hyphens
+    .replace(/[^a-z0-9]+/g, '-') // any run of non-alphanumerics (dashes included) → one hyphen
     .replace(/^-|-$/g, ''); // trim leading/trailing hyphens
 }